@@ -2,52 +2,49 @@
 
 This package provides CyberChef data transformation capabilities for IDA Pro
 through both a Qt widget interface and a programmatic API.
-"""
-
-# Main widget
-# Input parsing
-from ida_cyberchef.core.input_parser import InputFormat
-
-# Operation registry
-from ida_cyberchef.core.operation_registry import OperationRegistry
 
-# Recipe data structures
-from ida_cyberchef.core.recipe_models import OperationStep, RecipeDefinition
-
-# Core CyberChef API
-from ida_cyberchef.cyberchef import (
-    DishType,
-    bake,
-    get_chef,
-    load_cyberchef,
-    plate,
-)
-from ida_cyberchef.cyberchef_widget import CyberChefWidget
+The public names below are resolved on first access, so importing a single
+submodule such as ``ida_cyberchef.cyberchef`` does not pull in Qt.
+"""
 
-# Qt models
-from ida_cyberchef.qt_models.execution_model import ExecutionModel
-from ida_cyberchef.qt_models.input_model import InputModel, InputSource
-from ida_cyberchef.qt_models.recipe_model import RecipeModel
+import importlib
 
-__all__ = [
+_EXPORTS = {
     # Main widget
-    "CyberChefWidget",
+    "CyberChefWidget": "ida_cyberchef.cyberchef_widget",
     # Core CyberChef API
-    "bake",
-    "get_chef",
-    "load_cyberchef",
-    "plate",
-    "DishType",
+    "bake": "ida_cyberchef.cyberchef",
+    "bake_many": "ida_cyberchef.cyberchef",
+    "get_chef": "ida_cyberchef.cyberchef",
+    "load_cyberchef": "ida_cyberchef.cyberchef",
+    "plate": "ida_cyberchef.cyberchef",
+    "DishType": "ida_cyberchef.cyberchef",
     # Qt models
-    "InputModel",
-    "RecipeModel",
-    "ExecutionModel",
+    "InputModel": "ida_cyberchef.qt_models.input_model",
+    "RecipeModel": "ida_cyberchef.qt_models.recipe_model",
+    "ExecutionModel": "ida_cyberchef.qt_models.execution_model",
     # Enums
-    "InputSource",
-    "InputFormat",
+    "InputSource": "ida_cyberchef.qt_models.input_model",
+    "InputFormat": "ida_cyberchef.core.input_parser",
     # Recipe structures
-    "RecipeDefinition",
-    "OperationStep",
+    "RecipeDefinition": "ida_cyberchef.core.recipe_models",
+    "OperationStep": "ida_cyberchef.core.recipe_models",
     # Registry
-    "OperationRegistry",
-]
+    "OperationRegistry": "ida_cyberchef.core.operation_registry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
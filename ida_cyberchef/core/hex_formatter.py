@@ -47,6 +47,18 @@ class HexFormatter:
 
         return "\n".join(lines)
 
+    def format_file_listing(self, files: dict[str, bytes]) -> str:
+        """Format a multi-file result (e.g. from Unzip) as one line per file.
+
+        Args:
+            files: Mapping of filename to file contents
+
+        Returns: Lines like "test.txt (5 bytes)"
+        """
+        return "\n".join(
+            f"{name} ({len(data):,} bytes)" for name, data in files.items()
+        )
+
     def format_hex_string_unspaced(self, data: bytes) -> str:
         """Format bytes as unspaced hex string.
 
@@ -11,7 +11,7 @@ class StepResult:
     """Result of executing a single recipe step."""
 
     success: bool
-    data: Optional[bytes | str]
+    data: Optional[bytes | str | dict[str, bytes]]
     error: Optional[str]
 
 
@@ -31,20 +31,18 @@ class RecipeExecutor:
         """
         results = []
 
-        for i, step in enumerate(recipe):
+        chef_recipe = []
+        for s in recipe:
+            # Always use dict format for consistency
+            # Note: "if s["args"]:" would fail for empty dict {} since it's falsy
+            if s.get("args"):
+                chef_recipe.append({"op": s["operation"], "args": s["args"]})
+            else:
+                chef_recipe.append({"op": s["operation"]})
+
+        for i in range(len(chef_recipe)):
             try:
-                recipe_prefix = recipe[: i + 1]
-
-                chef_recipe = []
-                for s in recipe_prefix:
-                    # Always use dict format for consistency
-                    # Note: "if s["args"]:" would fail for empty dict {} since it's falsy
-                    if s.get("args"):
-                        chef_recipe.append({"op": s["operation"], "args": s["args"]})
-                    else:
-                        chef_recipe.append({"op": s["operation"]})
-
-                output = bake(input_data, chef_recipe)  # type: ignore[arg-type]
+                output = bake(input_data, chef_recipe[: i + 1])  # type: ignore[arg-type]
                 results.append(StepResult(success=True, data=output, error=None))
 
             except Exception as e:
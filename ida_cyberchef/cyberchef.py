@@ -6,6 +6,87 @@ import STPyV8
 
 _chef_instance = None
 
+# Binary data crosses the Python/JavaScript boundary as latin-1 strings (one
+# char per byte): converting a string is a single call either way, whereas
+# JSON int lists and JS arrays are converted element by element. Defined once
+# per context by load_cyberchef().
+_LATIN1_JS = """
+function latin1ToBuffer(s) {
+    const bytes = new Uint8Array(s.length);
+    for (let i = 0; i < s.length; i++) {
+        bytes[i] = s.charCodeAt(i);
+    }
+    return bytes.buffer;
+}
+
+function bytesToLatin1(value) {
+    let bytes;
+    if (value instanceof ArrayBuffer) {
+        bytes = new Uint8Array(value);
+    } else if (ArrayBuffer.isView(value)) {
+        bytes = new Uint8Array(value.buffer, value.byteOffset, value.byteLength);
+    } else {
+        bytes = Uint8Array.from(value);
+    }
+    // fromCharCode.apply takes its arguments on the stack, so go in chunks
+    let s = "";
+    for (let i = 0; i < bytes.length; i += 8192) {
+        s += String.fromCharCode.apply(null, bytes.subarray(i, i + 8192));
+    }
+    return s;
+}
+"""
+
+# Entry point for bake()/bake_many(), compiled once per context by
+# load_cyberchef(). Jobs arrive as one JSON document of [kind, data, recipe]
+# triples so each call is a JSON.parse rather than a fresh script compile.
+#
+# CyberChef resolves each operation name in a recipe by scanning its whole
+# operation list and normalizing every name on the way. Names are instead
+# looked up in a Map built once per context, using the same normalization
+# (spaces removed, lowercased), and passed to bake() as operation functions.
+# Like CyberChef's scan, the first operation with a given name wins: the
+# bundle has names that collide after normalization (e.g. two "PEM to JWK").
+# Unknown names are left as strings so CyberChef still reports them.
+_BAKE_JOBS_JS = """
+(function() {
+    const sanitise = (name) => name.replace(/ /g, "").toLowerCase();
+    const operationsByName = new Map();
+    for (const op of module.exports.operations) {
+        const key = sanitise(op.opName);
+        if (!operationsByName.has(key)) {
+            operationsByName.set(key, op);
+        }
+    }
+    const resolve = (name) => operationsByName.get(sanitise(name)) || name;
+    const resolveStep = (step) => {
+        if (typeof step === "string") {
+            return resolve(step);
+        }
+        if (step && typeof step.op === "string") {
+            return Object.assign({}, step, {op: resolve(step.op)});
+        }
+        return step;
+    };
+
+    return function(jobsJson) {
+        const Dish = module.exports.Dish;
+        return JSON.parse(jobsJson).map(([kind, data, recipe]) => {
+            let inputDish;
+            if (kind === "bytes") {
+                inputDish = new Dish(latin1ToBuffer(data), Dish.ARRAY_BUFFER);
+            } else if (kind === "string") {
+                inputDish = new Dish(data, Dish.STRING);
+            } else {
+                inputDish = new Dish(data);
+            }
+            const steps = Array.isArray(recipe) ? recipe.map(resolveStep) : recipe;
+            return module.exports.bake(inputDish, steps);
+        });
+    };
+})()
+"""
+
 
 class DishType(IntEnum):
     """CyberChef Dish type enumeration."""
@@ -148,9 +229,35 @@ def load_cyberchef(path: str | None = None):
     # Extract exports and attach context for later use
     chef = ctx.eval("module.exports")
     chef._stpyv8_context = ctx
+    ctx.eval(_LATIN1_JS)
+    chef._bake_jobs = ctx.eval(_BAKE_JOBS_JS)
+    chef._bytes_to_latin1 = ctx.eval("bytesToLatin1")
+    chef._bytes_dish = ctx.eval("""
+    (function(s) {
+        return new module.exports.Dish(latin1ToBuffer(s), module.exports.Dish.ARRAY_BUFFER);
+    })
+    """)
     return chef
 
 
+def _js_bytes(value, chef) -> bytes:
+    """Copy a JS ArrayBuffer, typed array or byte array into Python bytes.
+
+    Returns: The bytes, transferred as a single latin-1 string
+    """
+    return chef._bytes_to_latin1(value).encode("latin-1")
+
+
+def _file_bytes(file, chef) -> bytes:
+    """Read the contents of a CyberChef File object.
+
+    CyberChef's Node File polyfill keeps the contents in a Buffer at .data.
+
+    Returns: File contents as bytes
+    """
+    return _js_bytes(file.data, chef)
+
+
 def plate(v: Dish | Any, chef=None) -> Dish | Any:
     """Convert between Python types and CyberChef Dish objects.
 
@@ -169,6 +276,8 @@ def plate(v: Dish | Any, chef=None) -> Dish | Any:
         value = v["value"] if isinstance(v, dict) else v.value
 
         if dish_type == DishType.BYTE_ARRAY:
+            if isinstance(value, STPyV8.JSObject) and hasattr(chef, "_bytes_to_latin1"):
+                return _js_bytes(value, chef)
             if isinstance(value, list) or hasattr(value, "__iter__"):
                 value_list = list(value) if not isinstance(value, list) else value
                 if value_list and isinstance(value_list[0], float):
@@ -188,15 +297,8 @@ def plate(v: Dish | Any, chef=None) -> Dish | Any:
             return str(value)
         elif dish_type == DishType.ARRAY_BUFFER:
             if isinstance(value, STPyV8.JSObject):
-                if chef and hasattr(chef, "_stpyv8_context"):
-                    ctx = chef._stpyv8_context
-                    ctx.locals.array_buffer_value = value
-                    array_data = ctx.eval("""
-                    (function() {
-                        return Array.from(new Uint8Array(array_buffer_value));
-                    })
-                    """)()
-                    return bytes(list(array_data))
+                if hasattr(chef, "_bytes_to_latin1"):
+                    return _js_bytes(value, chef)
                 else:
                     return value
             elif isinstance(value, list) or hasattr(value, "__iter__"):
@@ -206,24 +308,22 @@ def plate(v: Dish | Any, chef=None) -> Dish | Any:
             return int(value) if isinstance(value, (int, float)) else value
         elif dish_type == DishType.JSON:
             return value
-        elif dish_type in (DishType.FILE, DishType.LIST_FILE):
+        elif dish_type == DishType.FILE:
+            if isinstance(value, STPyV8.JSObject):
+                if hasattr(chef, "_bytes_to_latin1"):
+                    return _file_bytes(value, chef)
+            return value
+        elif dish_type == DishType.LIST_FILE:
+            if isinstance(value, STPyV8.JSObject):
+                if hasattr(chef, "_bytes_to_latin1"):
+                    return {str(file.name): _file_bytes(file, chef) for file in value}
             return value
         else:
             return value
     else:
         if isinstance(v, bytes):
-            if chef is not None and hasattr(chef, "_stpyv8_context"):
-                byte_list = list(v)
-                byte_json = json.dumps(byte_list)
-                ctx = chef._stpyv8_context
-                dish = ctx.eval(f"""
-                (function() {{
-                    const byteArray = {byte_json};
-                    const uint8 = new Uint8Array(byteArray);
-                    return new module.exports.Dish(uint8.buffer, module.exports.Dish.ARRAY_BUFFER);
-                }})
-                """)()
-                return dish
+            if chef is not None and hasattr(chef, "_bytes_dish"):
+                return chef._bytes_dish(v.decode("latin-1"))
             else:
                 return {"value": list(v), "type": DishType.ARRAY_BUFFER}
         elif isinstance(v, str):
@@ -247,57 +347,88 @@ def plate(v: Dish | Any, chef=None) -> Dish | Any:
             return {"value": str(v), "type": DishType.STRING}
 
 
-def bake(input_data: bytes | str, recipe: list[str | RecipeOperation]) -> bytes | str:
+def _encode_job(input_data: bytes | str | Any, recipe: list) -> list:
+    """Encode one (input, recipe) pair as a JSON-serializable bake job.
+
+    Args:
+        input_data: Input data as bytes-like or string (other types are
+            JSON-serialized)
+        recipe: Recipe as accepted by bake()
+
+    Returns: [kind, data, recipe] triple understood by _BAKE_JOBS_JS
+    """
+    if isinstance(input_data, (bytes, bytearray, memoryview)):
+        return ["bytes", bytes(input_data).decode("latin-1"), recipe]
+    elif isinstance(input_data, str):
+        return ["string", input_data, recipe]
+    else:
+        # Fallback for other types - serialize as JSON
+        return ["json", input_data, recipe]
+
+
+def _run_jobs(chef, jobs: list[list]):
+    """Run encoded bake jobs in CyberChef and return the JS array of result Dishes.
+
+    Only a JSON string crosses into JavaScript; the input Dishes are built there.
+    """
+    return chef._bake_jobs(json.dumps(jobs))
+
+
+def bake(
+    input_data: bytes | bytearray | memoryview | str,
+    recipe: list[str | RecipeOperation],
+) -> bytes | str | dict[str, bytes]:
     """Execute CyberChef operations using native bake() function.
 
     Args:
-        input_data: Input data as bytes or string
+        input_data: Input data as bytes or string. Other bytes-like objects
+            (bytearray, memoryview) are accepted as binary input, so slices of
+            a shared buffer can be passed without copying them first. Text is
+            cheapest as str: it becomes a STRING Dish as-is, while bytes are
+            rebuilt as an ArrayBuffer in JavaScript.
         recipe: List of operations. Each operation is either:
             - A string operation name: "To Base64"
-            - A dict with op and args: {"op": "SHA2", "args": {"size": 256}}
+            - A dict with op and args: {"op": "SHA2", "args": {"size": "256"}}
 
-    Returns: Result as bytes or string depending on the final operation output
+    Returns: Result as bytes or string depending on the final operation output;
+        multi-file outputs (e.g. Unzip) are returned as a dict mapping each
+        filename to its contents
 
     Note: This function creates the CyberChef Dish object entirely in JavaScript
     to avoid STPyV8 JSObject bridging issues. Passing JSObjects through ctx.locals
     back into JavaScript code causes "TypeError: no access" errors.
     """
     chef = get_chef()
-    ctx = chef._stpyv8_context
-    recipe_json = json.dumps(recipe)
-
-    # Create the Dish and execute bake() entirely in JavaScript to avoid
-    # STPyV8 JSObject bridging issues with ctx.locals
-    if isinstance(input_data, bytes):
-        byte_list = list(input_data)
-        byte_json = json.dumps(byte_list)
-        result = ctx.eval(f"""
-        (function() {{
-            const byteArray = {byte_json};
-            const uint8 = new Uint8Array(byteArray);
-            const inputDish = new module.exports.Dish(uint8.buffer, module.exports.Dish.ARRAY_BUFFER);
-            const recipe = {recipe_json};
-            return module.exports.bake(inputDish, recipe);
-        }})
-        """)()
-    elif isinstance(input_data, str):
-        str_json = json.dumps(input_data)
-        result = ctx.eval(f"""
-        (function() {{
-            const inputDish = new module.exports.Dish({str_json}, module.exports.Dish.STRING);
-            const recipe = {recipe_json};
-            return module.exports.bake(inputDish, recipe);
-        }})
-        """)()
-    else:
-        # Fallback for other types - serialize as JSON
-        data_json = json.dumps(input_data)
-        result = ctx.eval(f"""
-        (function() {{
-            const inputDish = new module.exports.Dish({data_json});
-            const recipe = {recipe_json};
-            return module.exports.bake(inputDish, recipe);
-        }})
-        """)()
+    result = _run_jobs(chef, [_encode_job(input_data, recipe)])[0]
 
     return plate(result, chef)  # type: ignore[return-value]
+
+
+def bake_many(
+    jobs: list[
+        tuple[bytes | bytearray | memoryview | str, list[str | RecipeOperation]]
+    ],
+) -> list[bytes | str | dict[str, bytes]]:
+    """Execute several independent (input, recipe) jobs in one JavaScript call.
+
+    Equivalent to [bake(input_data, recipe) for input_data, recipe in jobs], but
+    crosses the Python/JavaScript boundary once for the whole batch.
+
+    Args:
+        jobs: List of (input_data, recipe) pairs, each as accepted by bake()
+
+    Returns: List of results, in the same order as jobs
+
+    Raises: Whatever the first failing job raises, as bake() would (e.g.
+        TypeError for an unknown operation, STPyV8.JSError for an
+        OperationError); no results are returned
+    """
+    if not jobs:
+        return []
+
+    chef = get_chef()
+    results = _run_jobs(
+        chef, [_encode_job(input_data, recipe) for input_data, recipe in jobs]
+    )
+
+    return [plate(results[i], chef) for i in range(len(jobs))]  # type: ignore[misc]
@@ -498,14 +498,18 @@ class OperationStepWidget(QFrame):
 
         return args
 
-    def set_preview_data(self, data: bytes):
+    def set_preview_data(self, data: bytes | dict[str, bytes]):
         """Set preview data to display.
 
         Args:
-            data: Bytes to display as hex dump
+            data: Bytes to display as hex dump, or a multi-file result to
+                display as a file listing
         """
-        hex_dump = self._hex_formatter.format_hex_dump(data)
-        self._preview_widget.setPlainText(hex_dump)
+        if isinstance(data, dict):
+            preview = self._hex_formatter.format_file_listing(data)
+        else:
+            preview = self._hex_formatter.format_hex_dump(data)
+        self._preview_widget.setPlainText(preview)
 
     def set_error(self, error: str):
         """Set error state and message.
@@ -72,7 +72,7 @@ class OutputPanel(QWidget):
         self._execution_model = execution_model
         self._input_model = input_model
         self._hex_formatter = HexFormatter()
-        self._current_output: bytes | str = b""
+        self._current_output: bytes | str | dict[str, bytes] = b""
         self._show_ida_buttons = show_ida_buttons
 
         self._setup_ui()
@@ -197,15 +197,18 @@ class OutputPanel(QWidget):
             if self._set_comment_button is not None:
                 self._set_comment_button.setEnabled(False)
 
-    def _render_output(self, data: bytes | str):
+    def _render_output(self, data: bytes | str | dict[str, bytes]):
         """Render output data using selected format.
 
         Args:
-            data: Bytes or string to render
+            data: Bytes or string to render, or a multi-file result, which is
+                always rendered as a file listing
         """
         format_name = self._output_format_combo.currentText()
 
-        if format_name == "Text":
+        if isinstance(data, dict):
+            formatted = self._hex_formatter.format_file_listing(data)
+        elif format_name == "Text":
             if isinstance(data, str):
                 formatted = data
             else:
@@ -246,13 +249,13 @@ class OutputPanel(QWidget):
         if self._current_output:
             self._render_output(self._current_output)
 
-    def _auto_select_format(self, data: bytes | str):
+    def _auto_select_format(self, data: bytes | str | dict[str, bytes]):
         """Auto-select output format based on data type.
 
         Args:
-            data: Output data (str for text, bytes for binary)
+            data: Output data (str for text, bytes for binary, dict for files)
         """
-        if isinstance(data, str):
+        if isinstance(data, (str, dict)):
             self._output_format_combo.setCurrentText("Text")
         else:
             self._output_format_combo.setCurrentText("Hex Dump")
@@ -274,6 +277,14 @@ class OutputPanel(QWidget):
         if not self._current_output:
             return
 
+        if isinstance(self._current_output, dict):
+            QMessageBox.warning(
+                self,
+                "Invalid Output Type",
+                "Cannot save multi-file output to a single file.",
+            )
+            return
+
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Output", "", "All Files (*)"
         )
@@ -333,6 +344,15 @@ class OutputPanel(QWidget):
             )
             return
 
+        if isinstance(self._current_output, dict):
+            QMessageBox.warning(
+                self,
+                "Invalid Output Type",
+                "Cannot copy multi-file output to IDB. "
+                "Only binary data can be patched.",
+            )
+            return
+
         address = self._input_model.get_external_address()
         if address is None:
             logger.warning(
@@ -5,13 +5,16 @@ including standard test constants, fixtures for common scenarios, and helper
 functions for roundtrip testing.
 """
 
+import functools
 import hashlib
 import string
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import pytest
+import STPyV8
 
-from ida_cyberchef.cyberchef import bake, get_chef, plate
+from ida_cyberchef.core.operation_registry import OperationRegistry
+from ida_cyberchef.cyberchef import bake, bake_many, get_chef, plate
 
 
 # ============================================================================
@@ -22,22 +25,26 @@ from ida_cyberchef.cyberchef import bake, get_chef, plate
 ALL_BYTES = bytes(range(256))
 
 # Common test strings
-HELLO_WORLD = b"Hello, World!"
+HELLO_WORLD_STR = "Hello, World!"
+HELLO_WORLD = HELLO_WORLD_STR.encode("ascii")
 EMPTY_STRING = b""
 EMPTY_BYTES = b""
 
 # ASCII printable characters
 ASCII_PRINTABLE = string.printable.encode("ascii")
 
-# UTF-8 test strings
-UTF8_SIMPLE = "Hello, World! 你好世界 🌍".encode("utf-8")
-UTF8_EMOJI = "🎉🚀💻🔥⭐".encode("utf-8")
-UTF8_MULTILANG = "Hello مرحبا こんにちは 안녕하세요 Привет".encode("utf-8")
+# UTF-8 test strings, as text (for string-input operations) and encoded bytes
+UTF8_SIMPLE_STR = "Hello, World! 你好世界 🌍"
+UTF8_EMOJI_STR = "🎉🚀💻🔥⭐"
+UTF8_MULTILANG_STR = "Hello مرحبا こんにちは 안녕하세요 Привет"
+UTF8_SIMPLE = UTF8_SIMPLE_STR.encode("utf-8")
+UTF8_EMOJI = UTF8_EMOJI_STR.encode("utf-8")
+UTF8_MULTILANG = UTF8_MULTILANG_STR.encode("utf-8")
 
 # Binary test data
 BINARY_ZEROS = bytes(16)
-BINARY_ONES = bytes([0xFF] * 16)
-BINARY_ALTERNATING = bytes([0xAA, 0x55] * 8)
+BINARY_ONES = b"\xff" * 16
+BINARY_ALTERNATING = b"\xaa\x55" * 8
 BINARY_SEQUENTIAL = bytes(range(32))
 
 # Base64 test vectors (standard from RFC 4648)
@@ -117,6 +124,30 @@ Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua."""
 # Test data for compression operations
 COMPRESSIBLE_DATA = b"AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA" * 10
 
+# Large enough to span several 32 KiB Deflate windows, small enough to keep
+# compressor tests fast (64 KiB)
+LARGE_COMPRESSIBLE = b"ABCDEFGH" * 8192
+
+# Container magic numbers, for checking compressor output with bytes.startswith
+GZIP_MAGIC = b"\x1f\x8b"
+ZLIB_MAGIC = b"\x78"
+LZ4_FRAME_MAGIC = b"\x04\x22\x4d\x18"
+
+# Valid zlib CMF bytes: CM=8 (Deflate) with any CINFO window size 0-7
+# (RFC 1950 section 2.2). ZLIB_MAGIC covers only the default 32 KiB window.
+ZLIB_CMF_BYTES = frozenset(range(0x08, 0x79, 0x10))
+
+# Exceptions bake() raises when CyberChef rejects an operation or its input.
+# STPyV8 maps JS TypeError, RangeError, ReferenceError and SyntaxError onto
+# Python builtins and reports everything else (e.g. OperationError) as JSError.
+BAKE_ERRORS = (
+    STPyV8.JSError,
+    TypeError,
+    IndexError,
+    ReferenceError,
+    SyntaxError,
+)
+
 
 # ============================================================================
 # Pytest Fixtures
@@ -136,6 +167,19 @@ def chef():
     return get_chef()
 
 
+@pytest.fixture(scope="session")
+def warm_chef(chef):
+    """Load CyberChef before the first test that bakes runs.
+
+    Loading the bundle takes about a second. Modules that bake request this
+    with pytestmark = pytest.mark.usefixtures("warm_chef"), which keeps that
+    cost out of whichever test happens to bake first, so per-test timings
+    (e.g. --durations) reflect the test itself. Under pytest-xdist each
+    worker warms its own instance.
+    """
+    bake("", ["To Hex"])
+
+
 @pytest.fixture
 def bake_fn() -> Callable[[bytes | str, list[str | dict[str, Any]]], bytes | str]:
     """Provide the bake function for tests.
@@ -168,6 +212,21 @@ def plate_fn():
     return plate
 
 
+@pytest.fixture(scope="session")
+def operation_smoke_test() -> Callable[..., bytes | str]:
+    """Provide a callable that smoke tests an operation.
+
+    The callable is the module-level assert_operation_succeeds(), so every
+    test shares one function object.
+
+    Example:
+        def test_all_encoding_ops(operation_smoke_test):
+            for op in ["To Base64", "To Hex", "URL Encode"]:
+                operation_smoke_test(op)
+    """
+    return assert_operation_succeeds
+
+
 # ============================================================================
 # Test Data Fixtures
 # ============================================================================
@@ -232,6 +291,26 @@ def base64_vectors():
     return BASE64_TEST_VECTORS
 
 
+@pytest.fixture(scope="session")
+def all_operations():
+    """Provide the names of all bundled CyberChef operations.
+
+    Returns:
+        tuple: Operation names from the bundled operation schema
+    """
+    return get_all_operations()
+
+
+@pytest.fixture(scope="session")
+def available_operations():
+    """Provide the set of bundled CyberChef operation names.
+
+    Returns:
+        frozenset: Operation names, for fast membership checks
+    """
+    return get_available_operations()
+
+
 @pytest.fixture
 def hash_vectors():
     """Provide standard hash test vectors.
@@ -247,24 +326,70 @@ def hash_vectors():
 # ============================================================================
 
 
+def bake_matrix(
+    input_data: bytes | str,
+    operation: str,
+    arg_name: str,
+    arg_values: Iterable[Any],
+) -> list[bytes | str]:
+    """Run one operation over several values of one argument in a single batch.
+
+    Args:
+        input_data: Input data as bytes or string
+        operation: CyberChef operation name
+        arg_name: Name of the argument to vary
+        arg_values: Values to try for that argument
+
+    Returns:
+        list: One bake() result per value, in order
+
+    Example:
+        outputs = bake_matrix(b"data", "Gzip", "Compression type", ["Fixed Huffman Coding"])
+    """
+    return bake_many([
+        (input_data, [{"op": operation, "args": {arg_name: value}}])
+        for value in arg_values
+    ])
+
+
+def bake_table(
+    jobs: dict[Any, tuple[bytes | str, list[str | dict[str, Any]]]],
+) -> dict[Any, Any]:
+    """Run keyed (input, recipe) jobs in a single batch and key the results alike.
+
+    Args:
+        jobs: Mapping of any hashable key to an (input_data, recipe) pair
+
+    Returns:
+        dict: Each key of jobs to its bake() result, in the same order
+
+    Example:
+        results = bake_table({algo: (b"hello", [algo]) for algo in ["MD5", "SHA1"]})
+    """
+    return dict(zip(jobs, bake_many(list(jobs.values()))))
+
+
 def roundtrip_test(
     input_data: bytes | str,
     encode_recipe: list[str | dict[str, Any]],
     decode_recipe: list[str | dict[str, Any]],
     expected: bytes | str | None = None,
+    bake_fn: Callable[..., bytes | str] = bake,
 ) -> bool:
     """Test that encode→decode returns the original input.
 
     This helper function performs a roundtrip test: it encodes the input data
     using the encode recipe, then decodes the result using the decode recipe,
     and verifies that the final output matches the original input (or expected
-    value if provided).
+    value if provided). Both recipes run back to back in a single bake.
 
     Args:
         input_data: The original input data to test
         encode_recipe: Recipe to encode the data
         decode_recipe: Recipe to decode the encoded data
         expected: Optional expected value after roundtrip (defaults to input_data)
+        bake_fn: Bake callable to run the combined recipe with, e.g. the bake_fn
+            fixture (defaults to bake)
 
     Returns:
         bool: True if roundtrip successful, False otherwise
@@ -288,13 +413,8 @@ def roundtrip_test(
         expected = input_data
 
     try:
-        # Encode
-        encoded = bake(input_data, encode_recipe)
-
-        # Decode
-        decoded = bake(encoded, decode_recipe)
-
-        # Compare
+        # Encode and decode as one recipe, in a single bake
+        decoded = bake_fn(input_data, [*encode_recipe, *decode_recipe])
         return decoded == expected
     except Exception:
         return False
@@ -332,6 +452,263 @@ def verify_hash(
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def _xor_table(key: int) -> bytes:
+    """Build the 256-entry bytes.translate() table for XOR with a single byte."""
+    return bytes(i ^ key for i in range(256))
+
+
+def xor_single_byte(input_data: bytes, key: int) -> bytes:
+    """XOR every byte of the input with a single-byte key.
+
+    This helper computes reference values for XOR-based tests using
+    bytes.translate(), so the per-byte work happens in C rather than in a
+    Python generator. NOT is the special case key=0xFF.
+
+    Args:
+        input_data: Data to transform
+        key: Single byte key (0x00-0xFF)
+
+    Returns:
+        bytes: The XORed data
+
+    Example:
+        encrypted = xor_single_byte(b"hello", 0x42)
+        assert bake(encrypted, [{"op": "XOR", "args": {"Key": {"option": "Hex", "string": "42"}}}]) == b"hello"
+    """
+    return input_data.translate(_xor_table(key))
+
+
+def xor_bytes(input_data: bytes, key: bytes) -> bytes:
+    """XOR the input with a repeating multi-byte key.
+
+    Reference implementation for XOR tests. The input and the repeated key are
+    XORed as two big integers, which keeps the per-byte loop in C.
+
+    Args:
+        input_data: Data to transform
+        key: Non-empty key, repeated to the length of the input
+
+    Returns:
+        bytes: The XORed data
+
+    Example:
+        assert xor_bytes(b"hello", b"\x01\x02") == b"igmnn"
+    """
+    if len(key) == 1:
+        return xor_single_byte(input_data, key[0])
+
+    length = len(input_data)
+    stream = (key * (length // len(key) + 1))[:length]
+    value = int.from_bytes(input_data, "big") ^ int.from_bytes(stream, "big")
+    return value.to_bytes(length, "big")
+
+
+@functools.lru_cache(maxsize=None)
+def _rotl_table(amount: int) -> bytes:
+    """Build the bytes.translate() table rotating each byte left by amount bits."""
+    return bytes(((i << amount) | (i >> (8 - amount))) & 0xFF for i in range(256))
+
+
+def rotate_left(input_data: bytes, amount: int, carry_through: bool = False) -> bytes:
+    """Reference implementation of CyberChef's Rotate left.
+
+    Without carry each byte is rotated on its own (a translate table lookup);
+    with carry the whole input is rotated as one big-endian bit string.
+
+    Args:
+        input_data: Data to rotate
+        amount: Number of bits, taken modulo 8 like CyberChef does
+        carry_through: Carry bits into the neighbouring byte
+
+    Returns:
+        bytes: The rotated data
+
+    Example:
+        assert rotate_left(b"\x80\x01", 1, carry_through=True) == b"\x00\x03"
+    """
+    amount %= 8
+    if not carry_through or not input_data:
+        return input_data.translate(_rotl_table(amount))
+
+    nbits = len(input_data) * 8
+    value = int.from_bytes(input_data, "big")
+    value = ((value << amount) | (value >> (nbits - amount))) & ((1 << nbits) - 1)
+    return value.to_bytes(len(input_data), "big")
+
+
+def assert_nonempty_bytes(value: Any) -> None:
+    """Assert that value is non-empty bytes (exactly bytes, not a subclass).
+
+    Args:
+        value: Result to check, typically from bake()
+
+    Raises:
+        AssertionError: If value is not bytes or is empty
+    """
+    assert type(value) is bytes and value, f"Expected non-empty bytes, got {value!r}"
+
+
+def gzip_header_length(data: bytes) -> int:
+    """Get the length of a gzip member header (RFC 1952 section 2.3).
+
+    Args:
+        data: Gzip data starting at the member header
+
+    Returns:
+        int: Offset of the DEFLATE stream within data
+    """
+    flags = data[3]
+    offset = 10
+    if flags & 0x04:  # FEXTRA
+        offset += 2 + int.from_bytes(data[offset:offset + 2], "little")
+    if flags & 0x08:  # FNAME
+        offset = data.index(0, offset) + 1
+    if flags & 0x10:  # FCOMMENT
+        offset = data.index(0, offset) + 1
+    if flags & 0x02:  # FHCRC
+        offset += 2
+    return offset
+
+
+def assert_zlib_header(data: bytes) -> None:
+    """Assert that data starts with a valid zlib header (RFC 1950 section 2.2).
+
+    Args:
+        data: Zlib data starting at the CMF byte
+
+    Raises:
+        AssertionError: If the CMF byte or the FCHECK bits are invalid
+    """
+    assert data[0] in ZLIB_CMF_BYTES, f"Invalid zlib CMF byte {data[0]:#04x}"
+    assert int.from_bytes(data[:2], "big") % 31 == 0, "Invalid zlib FCHECK bits"
+
+
+def assert_btype(stream: bytes, expected_btype: int) -> None:
+    """Assert the block type of the first block of a raw DEFLATE stream.
+
+    The block header's BFINAL bit is followed by two BTYPE bits (RFC 1951
+    section 3.2.3): 0 stored, 1 fixed Huffman, 2 dynamic Huffman.
+
+    Args:
+        stream: Raw DEFLATE stream (no gzip/zlib container)
+        expected_btype: Expected BTYPE value
+
+    Raises:
+        AssertionError: If the block type differs
+    """
+    btype = (stream[0] >> 1) & 0b11
+    assert btype == expected_btype, f"Expected BTYPE {expected_btype}, got {btype}"
+
+
+@functools.lru_cache(maxsize=None)
+def _registry() -> OperationRegistry:
+    """Load the bundled operation schema once per session."""
+    return OperationRegistry()
+
+
+@functools.lru_cache(maxsize=None)
+def get_all_operations() -> tuple[str, ...]:
+    """Get the names of all operations in the bundled CyberChef build.
+
+    Names come from the operation schema shipped with the package, so no
+    CyberChef instance is needed and the result is computed once.
+
+    Returns:
+        tuple: Operation names, e.g. ("A1Z26 Cipher Decode", ...)
+    """
+    return tuple(op["name"] for op in _registry().get_all_operations())
+
+
+@functools.lru_cache(maxsize=None)
+def get_available_operations() -> frozenset[str]:
+    """Get the set of bundled operation names, for membership checks.
+
+    Returns:
+        frozenset: Operation names, built once per session
+    """
+    return frozenset(get_all_operations())
+
+
+# Python type returned by bake() for each schema outputType. Types that plate()
+# passes through as JS objects (BigNumber, JSON) have no fixed mapping, nor
+# does "html": the Node API returns some of those (e.g. Entropy) unpresented.
+_SCHEMA_OUTPUT_TYPES: dict[str, type] = {
+    "string": str,
+    "byteArray": bytes,
+    "ArrayBuffer": bytes,
+    "number": float,
+    "File": bytes,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _operation_output_types() -> dict[str, type | None]:
+    """Map every bundled operation name to its bake() result type."""
+    return {
+        op["name"]: _SCHEMA_OUTPUT_TYPES.get(op["outputType"])
+        for op in _registry().get_all_operations()
+    }
+
+
+def get_operation_output_type(operation_name: str) -> type | None:
+    """Determine the output type of an operation without running it.
+
+    The type is read from the bundled operation schema, so this is a dict
+    lookup rather than a trial bake().
+
+    Args:
+        operation_name: CyberChef operation name
+
+    Returns:
+        str, bytes or float; None for unknown operations or outputs that
+        bake() returns as JS objects
+
+    Example:
+        assert get_operation_output_type("To Base64") is str
+        assert get_operation_output_type("From Base64") is bytes
+    """
+    return _operation_output_types().get(operation_name)
+
+
+def is_operation_available(operation_name: str) -> bool:
+    """Check whether the bundled CyberChef build provides an operation.
+
+    Args:
+        operation_name: CyberChef operation name
+
+    Returns:
+        True if the operation is in the bundled operation schema
+    """
+    return operation_name in get_available_operations()
+
+
+@functools.lru_cache(maxsize=None)
+def require_operations(*operation_names: str) -> pytest.MarkDecorator:
+    """Build a skip marker for tests that need specific operations.
+
+    The check runs at collection time against the operation schema, so a
+    missing operation skips the test without loading CyberChef. Markers are
+    cached, so tests needing the same operations share one.
+
+    Args:
+        *operation_names: CyberChef operation names the test uses
+
+    Returns:
+        pytest.mark.skipif marker
+
+    Example:
+        @require_operations("Gzip", "Gunzip")
+        def test_gzip_roundtrip():
+            ...
+    """
+    available = get_available_operations()
+    missing = [name for name in operation_names if name not in available]
+    return pytest.mark.skipif(
+        bool(missing), reason=f"Operations not available: {', '.join(missing)}"
+    )
+
+
 def get_python_hash(input_data: bytes, algorithm: str) -> str:
     """Get hash using Python's hashlib for comparison.
 
@@ -360,17 +737,20 @@ def assert_roundtrip(
     encode_recipe: list[str | dict[str, Any]],
     decode_recipe: list[str | dict[str, Any]],
     expected: bytes | str | None = None,
+    bake_fn: Callable[..., bytes | str] = bake,
 ) -> None:
     """Assert that encode→decode returns the original input.
 
     Like roundtrip_test but raises AssertionError with detailed information
-    on failure instead of returning bool.
+    on failure instead of returning bool. The encode half is baked on its own
+    only when the roundtrip fails, to show the intermediate value.
 
     Args:
         input_data: The original input data to test
         encode_recipe: Recipe to encode the data
         decode_recipe: Recipe to decode the encoded data
         expected: Optional expected value after roundtrip (defaults to input_data)
+        bake_fn: Bake callable to run the recipes with (defaults to bake)
 
     Raises:
         AssertionError: If roundtrip fails
@@ -385,14 +765,14 @@ def assert_roundtrip(
     if expected is None:
         expected = input_data
 
-    # Encode
-    encoded = bake(input_data, encode_recipe)
-
-    # Decode
-    decoded = bake(encoded, decode_recipe)
+    # Encode and decode as one recipe, in a single bake
+    decoded = bake_fn(input_data, [*encode_recipe, *decode_recipe])
+    if decoded == expected:
+        return
 
-    # Compare with detailed error message
-    assert decoded == expected, (
+    # Bake the encode half separately only to report it
+    encoded = bake_fn(input_data, encode_recipe)
+    raise AssertionError(
         f"Roundtrip failed:\n"
         f"  Input:    {input_data!r}\n"
         f"  Encoded:  {encoded!r}\n"
@@ -403,6 +783,47 @@ def assert_roundtrip(
     )
 
 
+def assert_encode_and_native_decode(
+    input_data: bytes | str,
+    encode_recipe: list[str | dict[str, Any]],
+    native_decoder: Callable[[bytes | str], Any],
+    expected: bytes | str | None = None,
+    bake_fn: Callable[..., bytes | str] = bake,
+) -> None:
+    """Assert that a Python decoder inverts a CyberChef encode recipe.
+
+    Like assert_roundtrip, but the decode half runs in Python (e.g.
+    zlib.decompress).
+
+    Args:
+        input_data: The original input data to test
+        encode_recipe: Recipe to encode the data
+        native_decoder: Python callable that decodes the encoded data
+        expected: Optional expected value after decoding (defaults to input_data)
+        bake_fn: Bake callable to run the encode recipe with (defaults to bake)
+
+    Raises:
+        AssertionError: If the decoded data differs from the expected value
+
+    Example:
+        assert_encode_and_native_decode(b"hello", ["Gzip"], gzip.decompress)
+    """
+    if expected is None:
+        expected = input_data
+
+    encoded = bake_fn(input_data, encode_recipe)
+    decoded = native_decoder(encoded)
+
+    assert decoded == expected, (
+        f"Native decode failed:\n"
+        f"  Input:    {input_data!r}\n"
+        f"  Encoded:  {encoded!r}\n"
+        f"  Decoded:  {decoded!r}\n"
+        f"  Expected: {expected!r}\n"
+        f"  Encode recipe: {encode_recipe}"
+    )
+
+
 def compare_with_python(
     input_data: bytes,
     cyberchef_recipe: list[str | dict[str, Any]],
@@ -438,6 +859,72 @@ def compare_with_python(
         return False
 
 
+def assert_operation_succeeds(
+    operation_name: str,
+    input_data: bytes | str = b"test",
+    args: dict[str, Any] | None = None,
+) -> bytes | str:
+    """Assert that an operation executes without error.
+
+    Args:
+        operation_name: CyberChef operation name
+        input_data: Input to run the operation on
+        args: Optional operation arguments
+
+    Returns:
+        The operation result, for further checks
+
+    Raises:
+        AssertionError: If the operation raises
+
+    Example:
+        assert_operation_succeeds("MD5", b"hello")
+        assert_operation_succeeds("SHA2", b"hello", {"size": "256"})
+    """
+    step = {"op": operation_name, "args": args} if args else operation_name
+    try:
+        return bake(input_data, [step])
+    except BAKE_ERRORS as e:
+        raise AssertionError(f"Operation {operation_name!r} failed: {e}") from e
+
+
+def run_operation_with_args(
+    operation_name: str,
+    input_data: bytes | str,
+    args: dict[str, Any],
+    expected_type: type | None = None,
+) -> tuple[bool, Any]:
+    """Run an operation with specific arguments and report whether it worked.
+
+    Only errors raised by CyberChef (BAKE_ERRORS) count as failures; anything
+    else, such as a bug in the bridge, propagates.
+
+    Args:
+        operation_name: CyberChef operation name
+        input_data: Input to run the operation on
+        args: Operation arguments
+        expected_type: Optional type the result must have
+
+    Returns:
+        tuple: (success, result), where result is the exception on failure
+
+    Example:
+        success, result = run_operation_with_args(
+            "SHA2", b"hello", {"size": "256"}, expected_type=str
+        )
+        assert success
+        assert len(result) == 64
+    """
+    try:
+        result = bake(input_data, [{"op": operation_name, "args": args}])
+    except BAKE_ERRORS as e:
+        return False, e
+
+    if expected_type is not None and not isinstance(result, expected_type):
+        return False, result
+    return True, result
+
+
 # ============================================================================
 # Parametrize Helpers
 # ============================================================================
@@ -17,17 +17,55 @@ Usage:
 import base64
 import importlib.util
 import json
+import re
 import sys
 from pathlib import Path
 from typing import Any
 
-# Import cyberchef.py directly without triggering ida_cyberchef/__init__.py
-# This avoids Qt dependencies that may not be available in all environments
-_cyberchef_path = Path(__file__).parent.parent.parent / "ida_cyberchef" / "cyberchef.py"
-_spec = importlib.util.spec_from_file_location("cyberchef", _cyberchef_path)
-_cyberchef = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_cyberchef)
+# Reuse ida_cyberchef.cyberchef when it is already imported (e.g. by
+# tests/conftest.py) so the session shares one loaded CyberChef V8 context.
+# Otherwise import cyberchef.py directly without triggering
+# ida_cyberchef/__init__.py, which avoids Qt dependencies that may not be
+# available in all environments.
+_cyberchef = sys.modules.get("ida_cyberchef.cyberchef")
+if _cyberchef is None:
+    _cyberchef_path = (
+        Path(__file__).parent.parent.parent / "ida_cyberchef" / "cyberchef.py"
+    )
+    _spec = importlib.util.spec_from_file_location("cyberchef", _cyberchef_path)
+    _cyberchef = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_cyberchef)
 bake = _cyberchef.bake
+bake_many = _cyberchef.bake_many
+
+# orjson parses the test files several times faster than the stdlib; both
+# accept bytes and raise json.JSONDecodeError (or a subclass) on bad input.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Runs of characters that are unsafe in a pytest node ID (spaces, punctuation,
+# non-ASCII letters) collapse to a single underscore.
+_TEST_ID_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_]+")
+
+
+def make_test_id(*parts: str) -> str:
+    """Build a pytest-friendly test ID from path-like parts.
+
+    Args:
+        *parts: ID components, e.g. category, operation and test name
+
+    Returns:
+        Parts sanitized and joined with "/"
+
+    Examples:
+        >>> make_test_id("encoding", "To Base64", "simple string")
+        "encoding/To_Base64/simple_string"
+    """
+    return "/".join(_TEST_ID_UNSAFE_RE.sub("_", part).strip("_") for part in parts)
 
 
 def decode_data_value(data_value: dict[str, Any]) -> bytes | str:
@@ -103,9 +141,7 @@ def load_test_file(path: str | Path) -> dict[str, Any]:
     Returns:
         Parsed test suite dict
     """
-    path = Path(path)
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _json_loads(Path(path).read_bytes())
 
 
 def load_all_test_files(base_path: str | Path = None) -> list[dict[str, Any]]:
@@ -123,7 +159,7 @@ def load_all_test_files(base_path: str | Path = None) -> list[dict[str, Any]]:
         base_path = Path(base_path)
 
     test_suites = []
-    for json_file in base_path.rglob("*.json"):
+    for json_file in sorted(base_path.rglob("*.json")):
         try:
             test_suites.append(load_test_file(json_file))
         except json.JSONDecodeError as e:
@@ -132,6 +168,17 @@ def load_all_test_files(base_path: str | Path = None) -> list[dict[str, Any]]:
     return test_suites
 
 
+def _check_result(
+    test_case: dict[str, Any], result: bytes | str
+) -> tuple[bool, str | None]:
+    """Compare a bake() result against a test case's expected output."""
+    expected = decode_data_value(test_case["expected"])
+    if result == expected:
+        return True, None
+    else:
+        return False, f"Expected {expected!r}, got {result!r}"
+
+
 def run_single_test(test_case: dict[str, Any]) -> tuple[bool, str | None]:
     """Run a single test case.
 
@@ -155,19 +202,42 @@ def run_single_test(test_case: dict[str, Any]) -> tuple[bool, str | None]:
         # Execute
         result = bake(input_data, operations)
 
-        # Decode expected output
-        expected = decode_data_value(test_case["expected"])
-
         # Compare
-        if result == expected:
-            return True, None
-        else:
-            return False, f"Expected {expected!r}, got {result!r}"
+        return _check_result(test_case, result)
 
     except Exception as e:
         return False, f"Exception: {type(e).__name__}: {e}"
 
 
+def run_test_batch(
+    test_cases: list[dict[str, Any]],
+) -> list[tuple[bool, str | None]]:
+    """Run several test cases, baking them all in one bake_many() call.
+
+    bake_many() gives up on the first failing job, so if any case raises, every
+    case is re-run with run_single_test() to attribute the error to it.
+
+    Args:
+        test_cases: Test case dicts as accepted by run_single_test()
+
+    Returns:
+        One (success, error_message) tuple per test case, in order
+    """
+    try:
+        outputs = iter(bake_many([
+            (decode_data_value(tc["input"]), tc["operations"])
+            for tc in test_cases
+            if not tc.get("skip", False)
+        ]))
+        return [
+            run_single_test(tc) if tc.get("skip", False)
+            else _check_result(tc, next(outputs))
+            for tc in test_cases
+        ]
+    except Exception:
+        return [run_single_test(tc) for tc in test_cases]
+
+
 def run_tests(test_suite: dict[str, Any]) -> dict[str, Any]:
     """Run all tests in a test suite.
 
@@ -186,9 +256,8 @@ def run_tests(test_suite: dict[str, Any]) -> dict[str, Any]:
         "results": []
     }
 
-    for test_case in test_suite.get("tests", []):
-        success, message = run_single_test(test_case)
-
+    test_cases = test_suite.get("tests", [])
+    for test_case, (success, message) in zip(test_cases, run_test_batch(test_cases)):
         test_result = {
             "name": test_case.get("name", "unnamed"),
             "success": success,
@@ -217,7 +286,7 @@ def generate_pytest_params(test_suite: dict[str, Any]) -> list[tuple]:
     """
     params = []
     for test_case in test_suite.get("tests", []):
-        test_id = test_case.get("name", "unnamed").replace(" ", "_")
+        test_id = make_test_id(test_case.get("name", "unnamed"))
         params.append((test_id, test_case))
     return params
 
@@ -231,7 +300,7 @@ def collect_all_tests() -> list[tuple[str, dict[str, Any]]]:
     all_tests = []
     base_path = Path(__file__).parent / "operations"
 
-    for json_file in base_path.rglob("*.json"):
+    for json_file in sorted(base_path.rglob("*.json")):
         try:
             test_suite = load_test_file(json_file)
             operation = test_suite.get("operation", json_file.stem)
@@ -240,7 +309,7 @@ def collect_all_tests() -> list[tuple[str, dict[str, Any]]]:
             for test_case in test_suite.get("tests", []):
                 test_name = test_case.get("name", "unnamed")
                 # Create a unique test ID
-                test_id = f"{category}/{operation}/{test_name}".replace(" ", "_")
+                test_id = make_test_id(category, operation, test_name)
 
                 # Add metadata to test case for better error reporting
                 enriched_case = {
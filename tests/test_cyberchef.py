@@ -1,6 +1,34 @@
+import gzip
 import hashlib
-
-from ida_cyberchef.cyberchef import bake, get_chef, plate
+import re
+
+import pytest
+
+from ida_cyberchef.cyberchef import bake, bake_many, get_chef, plate
+from tests.conftest import (
+    ALL_BYTES,
+    assert_nonempty_bytes,
+    get_operation_output_type,
+    run_operation_with_args,
+    xor_single_byte,
+)
+
+pytestmark = pytest.mark.usefixtures("warm_chef")
+
+MD5_HELLO = hashlib.md5(b"hello").hexdigest()
+SHA256_HELLO = hashlib.sha256(b"hello").hexdigest()
+# CyberChef's error for a recipe step naming no known operation
+UNKNOWN_OPERATION = re.compile(r"Couldn't find an operation")
+# P-256 public key; "PEM to JWK" names two bundled operations, which treat it
+# differently
+EC_PUBLIC_KEY_PEM = """-----BEGIN PUBLIC KEY-----
+MFkwEwYHKoZIzj0CAQYIKoZIzj0DAQcDQgAE/dabX7fRLSM3g7hmqVicCwe+T2YB
+ubkrzjd3pQU1HwvPYCsbLQhVQL2y7KlHor2cthOk77ileosvBYRYlmkenQ==
+-----END PUBLIC KEY-----
+"""
+LARGE_BINARY = ALL_BYTES * 1024
+LARGE_BINARY_NOT = xor_single_byte(LARGE_BINARY, 0xFF)
+LARGE_BINARY_MD5 = hashlib.md5(LARGE_BINARY).hexdigest()
 
 
 def rechef(dish_result, chef):
@@ -18,6 +46,14 @@ def rechef(dish_result, chef):
     return plate(plate(dish_result), chef)
 
 
+def test_get_chef_reuses_instance():
+    """Test that bake() runs in the one CyberChef context loaded per process."""
+    chef = get_chef()
+    bake(b"hello", ["To Base64"])
+    bake_many([(b"hello", ["To Hex"])])
+    assert get_chef() is chef
+
+
 def test_from_base64():
     chef = get_chef()
     test_input = "U28gbG9uZyBhbmQgdGhhbmtzIGZvciBhbGwgdGhlIGZpc2gu"
@@ -25,18 +61,21 @@ def test_from_base64():
     assert result == b"So long and thanks for all the fish."
 
 
-def test_to_hex():
-    chef = get_chef()
-    input_dish = plate(b"hello", chef)
-    result = plate(chef.toHex(input_dish))
-    assert result == "68 65 6c 6c 6f"
-
-
-def test_md5():
-    chef = get_chef()
+@pytest.mark.parametrize(
+    "method, args, expected",
+    [
+        ("toHex", None, "68 65 6c 6c 6f"),
+        ("MD5", None, MD5_HELLO),
+        # SHA2 size must be the string "256"; the integer 256 hashes differently
+        ("SHA2", {"size": "256"}, SHA256_HELLO),
+    ],
+)
+def test_chef_operation(chef, method, args, expected):
+    """Test calling operations directly on the CyberChef module."""
+    operation = getattr(chef, method)
     input_dish = plate(b"hello", chef)
-    result = plate(chef.MD5(input_dish))
-    assert result == "5d41402abc4b2a76b9719d911017c592"
+    result = operation(input_dish) if args is None else operation(input_dish, args)
+    assert plate(result) == expected
 
 
 def test_chained_operations_with_rechef():
@@ -47,10 +86,7 @@ def test_chained_operations_with_rechef():
     step1 = chef.toHex(input_dish)
     step2 = rechef(chef.fromHex(step1), chef)
     step3 = chef.MD5(step2)
-    result = plate(step3)
-
-    expected = "5d41402abc4b2a76b9719d911017c592"
-    assert result == expected
+    assert plate(step3) == MD5_HELLO
 
 
 def test_translate_datetime():
@@ -69,74 +105,97 @@ def test_parse_ipv6():
     assert "2001:0:4136:e378:8000:63bf:3fff:fdd2" in result
 
 
-def test_sha256():
-    """Test SHA2-256 produces correct standard hash.
-
-    Note: size must be a string "256", not integer 256.
-    """
-
-    chef = get_chef()
-    input_dish = plate(b"hello", chef)
-    result = plate(chef.SHA2(input_dish, {"size": "256"}))
-    expected = hashlib.sha256(b"hello").hexdigest()
-    assert result == expected
-
-
 def test_url_encode():
     chef = get_chef()
     result = plate(chef.URLEncode("Hello World!"))
     assert result == "Hello%20World!"
 
 
-def test_bake_simple():
-    """Test bake with simple operations."""
-    result = bake(b"hello", ["To Base64"])
-    assert result == "aGVsbG8="
-
-
-def test_bake_chain():
-    """Test bake with multiple operations."""
-    result = bake(b"hello", ["To Base64", "MD5"])
-    assert isinstance(result, str)
-    assert len(result) == 32
+@pytest.mark.parametrize(
+    "op, data, expected",
+    [
+        ("Sum", "1 2 3 4 5", 15),
+        ("Mean", "1 2 3 4", 2.5),
+        ("Median", "1 2 3 4", 2.5),
+        ("Divide", "10 4", 2.5),
+    ],
+)
+def test_bake_big_number(op, data, expected):
+    """Test arithmetic results numerically rather than by their string form."""
+    result = bake(data, [{"op": op, "args": ["Space"]}])
+    assert float(result) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "data, recipe, expected",
+    [
+        pytest.param(b"hello", ["To Base64"], "aGVsbG8=", id="simple"),
+        pytest.param(
+            b"hello",
+            ["To Base64", "MD5"],
+            hashlib.md5(b"aGVsbG8=").hexdigest(),
+            id="chain",
+        ),
+        # SHA2 size must be the string "256"; the integer 256 hashes differently
+        pytest.param(
+            b"hello", [{"op": "SHA2", "args": {"size": "256"}}], SHA256_HELLO, id="args"
+        ),
+        pytest.param(
+            b"hello",
+            [{"op": "SHA2", "args": {"size": "256"}}] * 2,
+            hashlib.sha256(SHA256_HELLO.encode()).hexdigest(),
+            id="sha2-composition",
+        ),
+        pytest.param(
+            b"hello",
+            [{"op": "To Hex"}, {"op": "SHA2", "args": {"size": "256"}}],
+            hashlib.sha256(b"68 65 6c 6c 6f").hexdigest(),
+            id="hex-to-sha2",
+        ),
+        pytest.param(
+            b"hello",
+            [{"op": "MD5"}, {"op": "MD5"}],
+            hashlib.md5(MD5_HELLO.encode()).hexdigest(),
+            id="md5-chain",
+        ),
+        pytest.param("Hello World!", ["URL Encode"], "Hello%20World!", id="url"),
+    ],
+)
+def test_bake(data, recipe, expected):
+    """Test bake against outputs computed independently of CyberChef."""
+    assert bake(data, recipe) == expected
 
 
 def test_bake_binary():
     """Test bake with binary data that needs to survive encoding."""
-    binary_data = bytes(range(256))
-    result = bake(binary_data, ["To Hex", "From Hex"])
-    assert result == binary_data
-
-
-def test_bake_with_args():
-    """Test bake with operations that have arguments.
-
-    Note: SHA2 size must be string "256", not integer 256.
+    result = bake(ALL_BYTES, ["To Hex", "From Hex"])
+    assert result == ALL_BYTES
+
+
+@pytest.mark.parametrize(
+    "data, recipe",
+    [
+        (b"AB", ["NOT"]),
+        (b"4142", ["From Hex"]),
+        # Fixed mtime, so every xdist worker collects the same parameters
+        (gzip.compress(b"AB", mtime=0), ["Gunzip"]),
+    ],
+    ids=["NOT", "From Hex", "Gunzip"],
+)
+def test_bake_returns_bytes_sanity(data, recipe):
+    """Test that byte-valued results come back as bytes, not str or a JS object.
+
+    Tests compare results by value, so they do not repeat this check.
     """
-    result = bake(b"hello", [{"op": "SHA2", "args": {"size": "256"}}])
-
-    # CyberChef's SHA2 should match standard hashlib
-    expected = hashlib.sha256(b"hello").hexdigest()
-    assert result == expected
-
-
-def test_bake_sha2_composition():
-    """Test SHA2 composition - double hashing works correctly."""
-    # Chain two SHA2 operations
-    result = bake(
-        b"hello",
-        [
-            {"op": "SHA2", "args": {"size": "256"}},
-            {"op": "SHA2", "args": {"size": "256"}},
-        ],
-    )
+    assert_nonempty_bytes(bake(data, recipe))
 
-    # Expected: SHA256(SHA256("hello"))
-    first_hash = hashlib.sha256(b"hello").hexdigest()
-    expected = hashlib.sha256(first_hash.encode()).hexdigest()
 
-    assert result == expected
-    assert len(result) == 64  # SHA256 produces 64 hex characters
+def test_bake_large_binary():
+    """Test that large binary data crosses the bridge intact in both directions."""
+    # Into JavaScript only: hash there, so just the digest comes back
+    assert bake(LARGE_BINARY, ["MD5"]) == LARGE_BINARY_MD5
+    # Both ways
+    assert bake(LARGE_BINARY, ["NOT"]) == LARGE_BINARY_NOT
 
 
 def test_bake_complex_chain():
@@ -147,40 +206,112 @@ def test_bake_complex_chain():
     result = bake(result, ["From Hex"])
     assert result == b"hello"
 
-    result = bake(result, ["MD5"])
-    expected = "5d41402abc4b2a76b9719d911017c592"
-    assert result == expected
+    assert bake(result, ["MD5"]) == MD5_HELLO
 
 
-def test_bake_hex_to_sha2_chain():
-    """Test chaining To Hex followed by SHA2."""
-    result = bake(b"hello", [{"op": "To Hex"}, {"op": "SHA2", "args": {"size": "256"}}])
+def test_bake_empty_recipe():
+    """Test bake with empty recipe returns input unchanged."""
+    assert bake(b"hello", []) == b"hello"
 
-    # Expected: SHA256 of "68 65 6c 6c 6f"
-    hex_str = "68 65 6c 6c 6f"
-    expected = hashlib.sha256(hex_str.encode()).hexdigest()
 
-    assert result == expected
+def test_bake_bytes_like_input():
+    """Test that bytearray and memoryview inputs are treated as bytes."""
+    data = ALL_BYTES
+    expected = bake(data[16:32], ["To Hex"])
+    assert bake(bytearray(data[16:32]), ["To Hex"]) == expected
+    assert bake(memoryview(data)[16:32], ["To Hex"]) == expected
 
 
-def test_bake_md5_chain():
-    """Test chaining MD5 operations."""
-    result = bake(b"hello", [{"op": "MD5"}, {"op": "MD5"}])
+@pytest.mark.parametrize("op", ["To Base64", "To Hex", "URL Encode"])
+def test_smoke_encoding_operations(operation_smoke_test, op):
+    """Test that common encoders run on default input."""
+    operation_smoke_test(op)
 
-    # Expected: MD5(MD5("hello"))
-    first_hash = hashlib.md5(b"hello").hexdigest()
-    expected = hashlib.md5(first_hash.encode()).hexdigest()
 
-    assert result == expected
+def test_available_operations(all_operations, available_operations):
+    """Test the cached operation names and the set used by require_operations."""
+    assert "To Base64" in available_operations
+    assert "No Such Operation" not in available_operations
+    assert available_operations == set(all_operations)
 
 
-def test_bake_url_operations():
-    """Test bake with URL encoding operations."""
-    result = bake("Hello World!", ["URL Encode"])
-    assert result == "Hello%20World!"
+def test_run_operation_with_args():
+    """Test success, type mismatch and CyberChef error reporting."""
+    success, result = run_operation_with_args(
+        "SHA2", b"hello", {"size": "256"}, expected_type=str
+    )
+    assert success
+    assert result == hashlib.sha256(b"hello").hexdigest()
 
+    success, _ = run_operation_with_args(
+        "SHA2", b"hello", {"size": "256"}, expected_type=bytes
+    )
+    assert not success
 
-def test_bake_empty_recipe():
-    """Test bake with empty recipe returns input unchanged."""
-    result = bake(b"hello", [])
-    assert result == b"hello" or result == "hello"
+    success, error = run_operation_with_args("InvalidOp", b"hello", {})
+    assert not success
+    assert "Couldn't find an operation" in str(error)
+
+
+def test_bake_many_matches_bake():
+    """Test that a batch returns the same results as individual bakes."""
+    jobs = [
+        (b"hello", ["To Base64"]),
+        ("aGVsbG8=", ["From Base64"]),
+        (ALL_BYTES, ["To Hex", "From Hex"]),
+        (b"", ["MD5"]),
+    ]
+    assert bake_many(jobs) == [bake(data, recipe) for data, recipe in jobs]
+
+
+def test_bake_many_empty():
+    """Test that an empty batch does not touch CyberChef."""
+    assert bake_many([]) == []
+
+
+def test_bake_many_error():
+    """Test that a failing job raises for the whole batch."""
+    with pytest.raises(TypeError, match=UNKNOWN_OPERATION):
+        bake_many([(b"hello", ["To Base64"]), (b"hello", ["InvalidOp"])])
+
+
+@pytest.mark.parametrize(
+    "recipe", [["to base64"], ["TOBASE64"], [{"op": "to Base64"}], ["To Base64"]]
+)
+def test_bake_operation_name_matching(recipe):
+    """Test that operation names match ignoring case and spaces, as in CyberChef."""
+    assert bake(b"hello", recipe) == "aGVsbG8="
+
+
+def test_bake_unknown_operation():
+    """Test that an unknown operation name is still reported by CyberChef."""
+    with pytest.raises(TypeError, match=UNKNOWN_OPERATION):
+        bake(b"hello", ["No Such Operation"])
+
+
+def test_bake_duplicate_operation_name_uses_first_match():
+    """Test that a name shared by two operations resolves as CyberChef does.
+
+    CyberChef takes the first operation in its list whose name matches. The
+    first "PEM to JWK" parses its input as JSON and rejects a PEM; the second
+    would convert it.
+    """
+    with pytest.raises(SyntaxError):
+        bake(EC_PUBLIC_KEY_PEM, ["PEM to JWK"])
+
+
+@pytest.mark.parametrize(
+    "operation,input_data",
+    [
+        ("To Base64", b"hello"),
+        ("From Base64", "aGVsbG8="),
+        ("MD5", b"hello"),
+        ("Gzip", b"hello"),
+        ("NOT", b"hello"),
+        ("Chi Square", b"hello"),
+        ("Zip", b"hello"),
+    ],
+)
+def test_static_output_type_matches_bake(operation, input_data):
+    """Test that the schema-derived output type agrees with bake()."""
+    assert type(bake(input_data, [operation])) is get_operation_output_type(operation)
@@ -14,8 +14,7 @@ def test_format_multiple_lines():
     data = b"A" * 32
     result = formatter.format_hex_dump(data)
 
-    lines = result.strip().split("\n")
-    assert len(lines) == 2  # 16 bytes per line
+    assert len(result.splitlines()) == 2  # 16 bytes per line
 
 
 def test_format_with_non_printable():
@@ -260,6 +259,18 @@ class TestCInitializedVariable:
     def test_hex_formatting_lowercase(self):
         formatter = HexFormatter()
         result = formatter.format_c_initialized_variable(b"\xab\xcd\xef")
-        assert "0xab" in result
-        assert "0xcd" in result
-        assert "0xef" in result
+        assert result == "unsigned char data[3] = {\n    0xab, 0xcd, 0xef\n};"
+
+
+class TestFileListing:
+    """Tests for format_file_listing method."""
+
+    def test_one_line_per_file(self):
+        formatter = HexFormatter()
+        result = formatter.format_file_listing({"a.txt": b"Hello", "b/c.bin": b""})
+        assert result == "a.txt (5 bytes)\nb/c.bin (0 bytes)"
+
+    def test_thousands_separator(self):
+        formatter = HexFormatter()
+        result = formatter.format_file_listing({"big.bin": bytes(4096)})
+        assert result == "big.bin (4,096 bytes)"
@@ -26,19 +26,36 @@ Example JSON test file structure:
 
 import pytest
 
+from tests.conftest import ALL_BYTES, require_operations
 from tests.data.runner import collect_all_tests, decode_data_value, run_single_test
 
+pytestmark = pytest.mark.usefixtures("warm_chef")
+
+
+def _case_marks(test_case: dict) -> list[pytest.MarkDecorator]:
+    """Collection-time skip marks for a JSON test case.
+
+    Cases flagged "skip" and cases using operations missing from the bundled
+    build are skipped before any fixture setup or bake().
+    """
+    if test_case.get("skip", False):
+        reason = test_case.get("skipReason", "Test marked as skip")
+        return [pytest.mark.skip(reason=reason)]
+    operations = tuple(
+        step if isinstance(step, str) else step["op"]
+        for step in test_case["operations"]
+    )
+    return [require_operations(*operations)]
+
 
 def pytest_generate_tests(metafunc):
     """Dynamically generate test cases from JSON files."""
     if "json_test_case" in metafunc.fixturenames:
-        all_tests = collect_all_tests()
-        if all_tests:
-            ids, cases = zip(*all_tests)
-            metafunc.parametrize("json_test_case", cases, ids=ids)
-        else:
-            # No tests found, parametrize with empty list
-            metafunc.parametrize("json_test_case", [])
+        params = [
+            pytest.param(case, id=test_id, marks=_case_marks(case))
+            for test_id, case in collect_all_tests()
+        ]
+        metafunc.parametrize("json_test_case", params)
 
 
 class TestJSONOperations:
@@ -50,12 +67,7 @@ class TestJSONOperations:
         This test is parametrized by pytest_generate_tests to run once
         for each test case defined in the JSON files.
         """
-        # Check for skip
-        if json_test_case.get("skip", False):
-            reason = json_test_case.get("skipReason", "Test marked as skip")
-            pytest.skip(reason)
-
-        # Run the test
+        # Run the test (skipped cases never get here; see _case_marks)
         success, message = run_single_test(json_test_case)
 
         if not success:
@@ -141,12 +153,48 @@ class TestJSONTestRunner:
         decoded = decode_data_value(encoded)
         assert decoded == original
 
-    def test_roundtrip_bytes(self):
+    @pytest.mark.parametrize("encoding", ["base64", "hex"])
+    def test_roundtrip_bytes(self, encoding):
         """Test bytes encode/decode roundtrip."""
         from tests.data.runner import decode_data_value, encode_data_value
 
-        original = bytes(range(256))
-        for encoding in ["base64", "hex"]:
-            encoded = encode_data_value(original, encoding=encoding)
-            decoded = decode_data_value(encoded)
-            assert decoded == original, f"Failed for encoding {encoding}"
+        encoded = encode_data_value(ALL_BYTES, encoding=encoding)
+        assert decode_data_value(encoded) == ALL_BYTES
+
+    def test_make_test_id(self):
+        """Test that test IDs collapse unsafe character runs."""
+        from tests.data.runner import make_test_id
+
+        assert make_test_id("encoding", "To Base64", "simple string") == (
+            "encoding/To_Base64/simple_string"
+        )
+        assert make_test_id("encryption", "Vigenère Cipher", "key (repeat)") == (
+            "encryption/Vigen_re_Cipher/key_repeat"
+        )
+
+    def test_run_tests_batch_isolates_failures(self):
+        """Test that a failing case in a batched suite is reported on its own."""
+        from tests.data.runner import encode_data_value, run_tests
+
+        def case(name, data, operations, expected):
+            return {
+                "name": name,
+                "input": encode_data_value(data),
+                "operations": operations,
+                "expected": encode_data_value(expected),
+            }
+
+        suite = {
+            "operation": "To Base64",
+            "tests": [
+                case("ok", b"hello", ["To Base64"], "aGVsbG8="),
+                case("wrong", b"hello", ["To Base64"], "nope"),
+                case("raises", "hello", ["No Such Operation"], ""),
+                {**case("skipped", b"", ["MD5"], ""), "skip": True},
+            ],
+        }
+        results = run_tests(suite)
+
+        assert (results["passed"], results["failed"], results["skipped"]) == (1, 2, 1)
+        assert [r["success"] for r in results["results"]] == [True, False, False, True]
+        assert "Exception" in results["results"][2]["message"]
@@ -1,10 +1,15 @@
 """Tests for operation documentation formatting."""
 
+import re
+
 from ida_cyberchef.core.operation_doc_formatter import (
     format_operation_docs,
     strip_html_tags,
 )
 
+# Any HTML tag, so one scan checks that none survived formatting
+HTML_TAG_RE = re.compile(r"</?[a-z][^>]*>")
+
 
 def test_format_operation_docs_full():
     """Test formatting operation with all fields."""
@@ -102,9 +107,7 @@ def test_format_operation_docs_with_html():
 
     assert "A1Z26 Cipher Decode" in result
     assert "Category: Encryption / Encoding" in result
-    assert "<br>" not in result
-    assert "<code>" not in result
-    assert "</code>" not in result
+    assert not HTML_TAG_RE.search(result)
     assert "1 becomes a" in result
     assert "2 becomes b" in result
     assert result.count("\n\n") >= 2
@@ -122,12 +125,7 @@ def test_format_operation_docs_with_complex_html():
     result = format_operation_docs(operation)
 
     assert "AES Decrypt" in result
-    assert "<b>" not in result
-    assert "</b>" not in result
-    assert "<ul>" not in result
-    assert "<li>" not in result
-    assert "</li>" not in result
-    assert "</ul>" not in result
+    assert not HTML_TAG_RE.search(result)
     assert "Key:" in result
     assert "16 bytes = AES-128" in result
     assert "24 bytes = AES-192" in result
@@ -0,0 +1,62 @@
+"""Property-based tests for algebraic identities of CyberChef operations.
+
+The JSON test data in tests/data/operations pins individual input/output
+vectors. These tests complement them by drawing random inputs and keys and
+checking identities that must hold for all of them, e.g. XOR being its own
+inverse.
+"""
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from ida_cyberchef.cyberchef import bake
+from tests.conftest import rotate_left, xor_bytes
+
+DATA = st.binary(max_size=256)
+KEYS = st.binary(min_size=1, max_size=16)
+
+pytestmark = [pytest.mark.slow, pytest.mark.usefixtures("warm_chef")]
+
+
+def hex_key_op(op: str, key: bytes, *extra_args) -> dict:
+    """Build a recipe step for an operation keyed by a hex string."""
+    return {"op": op, "args": [{"option": "Hex", "string": key.hex()}, *extra_args]}
+
+
+@settings(deadline=None)
+@given(data=DATA, key=KEYS)
+def test_xor_involution(data, key):
+    """(A XOR K) XOR K = A for any key."""
+    xor = hex_key_op("XOR", key, "Standard", False)
+    assert bake(data, [xor, xor]) == data
+
+
+@settings(deadline=None)
+@given(data=DATA, key=KEYS)
+def test_xor_matches_reference(data, key):
+    """CyberChef's XOR agrees with a Python reference implementation."""
+    xor = hex_key_op("XOR", key, "Standard", False)
+    assert bake(data, [xor]) == xor_bytes(data, key)
+
+
+@settings(deadline=None)
+@given(data=DATA, amount=st.integers(0, 16), carry=st.booleans())
+def test_rotate_left_matches_reference(data, amount, carry):
+    """CyberChef's Rotate left agrees with a Python reference implementation."""
+    step = {"op": "Rotate left", "args": [amount, carry]}
+    assert bake(data, [step]) == rotate_left(data, amount, carry)
+
+
+@settings(deadline=None)
+@given(data=DATA)
+def test_not_involution(data):
+    """NOT(NOT(A)) = A."""
+    assert bake(data, ["NOT", "NOT"]) == data
+
+
+@settings(deadline=None)
+@given(data=DATA, key=KEYS)
+def test_sub_add_inverse(data, key):
+    """(A + K) - K = A, with byte-wise wraparound."""
+    assert bake(data, [hex_key_op("ADD", key), hex_key_op("SUB", key)]) == data
@@ -51,7 +51,7 @@ def test_fuzzy_search_operations():
     assert len(results) > 0
     assert any("hex" in r["name"].lower() for r in results)
     # Results should be ranked by relevance
-    assert results[0]["name"].lower().find("hex") >= 0
+    assert "hex" in results[0]["name"].lower()
 
 
 def test_acronym_search_operations():
@@ -56,3 +56,17 @@ def test_togglestring_dict_value_displays_correctly(qtbot):
     # Should extract "deadbeef" for input, "Hex" for dropdown
     assert value_input.text() == "deadbeef"
     assert format_combo.currentText() == "Hex"
+
+
+def test_preview_multi_file_result_lists_files(qtbot):
+    """A multi-file result (e.g. from Unzip) previews as a file listing."""
+    registry = OperationRegistry()
+    unzip_op = registry.find_operation("Unzip")
+    assert unzip_op is not None
+
+    widget = OperationStepWidget(0, unzip_op)
+    qtbot.addWidget(widget)
+
+    widget.set_preview_data({"test.txt": b"Hello"})
+
+    assert widget._preview_widget.toPlainText() == "test.txt (5 bytes)"
@@ -1,7 +1,11 @@
+import pytest
+
 from ida_cyberchef.qt_models.execution_model import ExecutionModel
 from ida_cyberchef.qt_models.input_model import InputModel
 from ida_cyberchef.qt_models.recipe_model import RecipeModel
 
+pytestmark = pytest.mark.usefixtures("warm_chef")
+
 
 def test_create_execution_model():
     input_model = InputModel()
@@ -1,5 +1,9 @@
+import pytest
+
 from ida_cyberchef.core.recipe_executor import RecipeExecutor
 
+pytestmark = pytest.mark.usefixtures("warm_chef")
+
 
 def test_execute_single_operation():
     executor = RecipeExecutor()